@@ -1 +1,2 @@
-from .normal import NormalArm
\ No newline at end of file
+from .normal import NormalArm
+from .pdf_cache import PdfGridCache, pdf_cache
\ No newline at end of file
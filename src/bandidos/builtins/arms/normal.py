@@ -2,6 +2,7 @@ import numpy as np
 from scipy.stats import norm
 
 from bandidos import BanditArm
+from .pdf_cache import pdf_cache
 
 class NormalArm(BanditArm):
   '''
@@ -17,7 +18,11 @@ class NormalArm(BanditArm):
   p = BanditProblem(50)
   p.add_arm(NormalArm, 15, 0.2)
   ```
+
+  The PDF grid returned by `pdf()` is shared, read-only, between all arms with the same mean & sd through `pdf_cache`. The number of points in the grid can be changed by setting the class attribute `pdf_resolution`.
   '''
+  pdf_resolution = 100
+
   def setup(self, steps, *args):
     self._mean = None
     self._sd = None
@@ -44,16 +49,12 @@ class NormalArm(BanditArm):
     if self._sd is None:
       self._sd = 1.0
     
-    # As this is a stationary arm, we can calculate the PDF at this time rather than on each step
-    self._pdf_x = np.linspace(
-      norm.ppf(0.01, loc=self._mean, scale=self._sd), # The x at the 1st precentile
-      norm.ppf(0.99, loc=self._mean, scale=self._sd), # The x at the 99th precentile
-      100 # Spread 100 points between these two x's 
-    )
-    self._pdf_y = norm.pdf(
-      self._pdf_x, # For each of the 100 points evaluate the PDF
-      loc=self._mean,
-      scale=self._sd
+    # As this is a stationary arm, we can calculate the PDF at this time rather than on each step (shared with any identical arm)
+    self._pdf_x, self._pdf_y = pdf_cache.get(
+      'normal',
+      (self._mean, self._sd),
+      self.pdf_resolution,
+      self._compute_pdf
     )
 
   # Create read-only properties for mean & sd
@@ -64,6 +65,20 @@ class NormalArm(BanditArm):
   def sd(self):
     return self._sd
   
+  def _compute_pdf(self, resolution):
+    x = np.linspace(
+      norm.ppf(0.01, loc=self._mean, scale=self._sd), # The x at the 1st precentile
+      norm.ppf(0.99, loc=self._mean, scale=self._sd), # The x at the 99th precentile
+      resolution # Spread points between these two x's
+    )
+    y = norm.pdf(
+      x, # For each point evaluate the PDF
+      loc=self._mean,
+      scale=self._sd
+    )
+
+    return x, y
+
   def pdf(self, step):
     return self._pdf_x, self._pdf_y 
 
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+class PdfGridCache:
+  '''
+  A bounded, least recently used cache of PDF grids shared by every arm in the process.
+
+  Stationary arms (such as `NormalArm`) compute an x,y grid of their PDF once during setup. When many arms, possibly across many replicate problems, share the same distribution parameters this work is repeated needlessly. Entries are keyed by `(family, params, resolution)` and stored as read-only numpy arrays so that identical arms share a single buffer.
+
+  The `hits` and `misses` counters can be used to tune `maxsize`.
+
+  ```python
+  from bandidos.builtins.arms import pdf_cache
+
+  pdf_cache.maxsize = 1024
+  ...
+  print(pdf_cache.hits, pdf_cache.misses)
+  ```
+  '''
+  def __init__(self, maxsize: int = 256):
+    self._entries = OrderedDict()
+    self._hits = 0
+    self._misses = 0
+
+    # Use property setter for validation
+    self.maxsize = maxsize
+
+  @property
+  def maxsize(self):
+    '''
+    The maximum number of grids retained. Lowering this value will immediately evict the least recently used entries.
+    '''
+    return self._maxsize
+
+  @maxsize.setter
+  def maxsize(self, maxsize):
+    assert isinstance(maxsize, int), f"PdfGridCache maxsize must be an integer not {type(maxsize)}"
+    assert maxsize >= 0, "PdfGridCache maxsize must be non-negative integer"
+
+    self._maxsize = maxsize
+    self._evict()
+
+  # Expose read only counters
+  @property
+  def hits(self):
+    return self._hits
+  @property
+  def misses(self):
+    return self._misses
+
+  def __len__(self):
+    return len(self._entries)
+
+  def get(self, family, params, resolution, compute):
+    '''
+    Return the `(x, y)` grid for the distribution `family` with hashable `params` evaluated at `resolution` points.
+
+    On a miss `compute(resolution)` is called to produce the grid, both arrays are marked read-only, and the result is stored for future calls.
+    '''
+    assert isinstance(resolution, int), f"PDF resolution must be an integer not {type(resolution)}"
+    assert resolution > 1, "PDF resolution must be an integer greater than 1"
+
+    key = (family, tuple(params), resolution)
+
+    if key in self._entries:
+      self._hits += 1
+      self._entries.move_to_end(key)
+      return self._entries[key]
+
+    self._misses += 1
+
+    x, y = compute(resolution)
+    # Shared between arms so must not be modified by any one of them
+    x.setflags(write=False)
+    y.setflags(write=False)
+
+    grid = (x, y)
+    self._entries[key] = grid
+    self._evict()
+
+    return grid
+
+  def clear(self):
+    '''
+    Drop all cached grids and reset the hit / miss counters.
+    '''
+    self._entries.clear()
+    self._hits = 0
+    self._misses = 0
+
+  def _evict(self):
+    while len(self._entries) > self._maxsize:
+      self._entries.popitem(last=False)
+
+# Process wide cache used by the builtin arms
+pdf_cache = PdfGridCache()
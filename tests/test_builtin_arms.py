@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 from scipy.stats import norm
 
-from bandidos.builtins.arms import NormalArm
+from bandidos.builtins.arms import NormalArm, PdfGridCache, pdf_cache
 
 class TestNormalArm:
   def test_basic_init(self):
@@ -41,4 +41,77 @@ class TestNormalArm:
 
     for i in range(10):
       s = a.sample(1)
-      assert isinstance(s, float)
\ No newline at end of file
+      assert isinstance(s, float)
+  
+  def test_pdf_shared(self):
+    a = NormalArm(3, 5.0, 2.0)
+    b = NormalArm(3, 5.0, 2.0)
+    c = NormalArm(3, 5.0, 3.0)
+
+    # Identical arms share the same read-only buffers
+    assert a.pdf(1)[0] is b.pdf(1)[0]
+    assert a.pdf(1)[1] is b.pdf(1)[1]
+    assert a.pdf(1)[0] is not c.pdf(1)[0]
+
+    x, y = a.pdf(1)
+    with pytest.raises(ValueError):
+      y[0] = 1
+
+  def test_pdf_resolution(self):
+    class FineArm(NormalArm):
+      pdf_resolution = 500
+
+    x, y = FineArm(3).pdf(1)
+    assert len(x) == 500
+    assert len(y) == 500
+    assert len(NormalArm(3).pdf(1)[0]) == 100
+
+class TestPdfGridCache:
+  def compute(self, resolution):
+    return np.linspace(0, 1, resolution), np.ones(resolution)
+
+  def test_hits_misses(self):
+    c = PdfGridCache()
+
+    first = c.get('test', (1,), 10, self.compute)
+    assert c.misses == 1
+    assert c.hits == 0
+
+    second = c.get('test', (1,), 10, self.compute)
+    assert second is first
+    assert c.misses == 1
+    assert c.hits == 1
+
+    # Different resolution is a different entry
+    c.get('test', (1,), 20, self.compute)
+    assert c.misses == 2
+    assert len(c) == 2
+
+    c.clear()
+    assert len(c) == 0
+    assert c.hits == 0
+    assert c.misses == 0
+
+  def test_lru_eviction(self):
+    c = PdfGridCache(maxsize=2)
+
+    c.get('test', (1,), 10, self.compute)
+    c.get('test', (2,), 10, self.compute)
+    c.get('test', (1,), 10, self.compute) # (2,) is now least recently used
+    c.get('test', (3,), 10, self.compute)
+    assert len(c) == 2
+
+    c.get('test', (1,), 10, self.compute)
+    assert c.hits == 2
+    c.get('test', (2,), 10, self.compute)
+    assert c.misses == 4
+
+    # Shrinking evicts immediately
+    c.maxsize = 1
+    assert len(c) == 1
+
+  def test_invalid_maxsize(self):
+    with pytest.raises(AssertionError):
+      PdfGridCache(maxsize=-1)
+    with pytest.raises(AssertionError):
+      pdf_cache.maxsize = 1.5